@@ -15,6 +15,7 @@ from .enderchest import EnderChest, create_ender_chest
 from .gather import gather_minecraft_instances
 from .instance import InstanceSpec, normalize_modloader
 from .inventory import (
+    clear_config_cache,
     load_ender_chest,
     load_ender_chest_instances,
     load_ender_chest_remotes,
@@ -128,6 +129,7 @@ def craft_ender_chest(
                 ender_chest.register_remote(*extra_remote)
 
     create_ender_chest(minecraft_root, ender_chest)
+    clear_config_cache()
     CRAFT_LOGGER.info(
         "\nNow craft some shulker boxes via\n$ enderchest craft shulker_box\n"
     )
@@ -233,6 +235,7 @@ def craft_shulker_box(
         return
 
     create_shulker_box(minecraft_root, shulker_box, folders)
+    clear_config_cache()
 
 
 def specify_ender_chest_from_prompt(minecraft_root: Path) -> EnderChest:
@@ -713,7 +716,7 @@ def _prompt_for_filters(
         example_tags: list[str] = [tag for tag, _ in tag_count.most_common(5)]
         CRAFT_LOGGER.debug(
             "Tag counts:\n%s",
-            "\n".join(f"  - {tag}: {count}" for tag, count in tag_count.items()),
+            "\n".join([f"  - {tag}: {count}" for tag, count in tag_count.items()]),
         )
 
         if len(example_tags) == 0:
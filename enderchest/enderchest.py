@@ -13,11 +13,16 @@ from . import sync
 from .loggers import CRAFT_LOGGER, GATHER_LOGGER, INVENTORY_LOGGER
 from .sync import abspath_from_uri
 
+# the sync exclusion that keeps each EnderChest's config file its own
+_CHEST_CFG_EXCLUSION = "/".join(
+    (fs.ENDER_CHEST_FOLDER_NAME, fs.ENDER_CHEST_CONFIG_NAME)
+)
+
 _DEFAULTS = (
     ("offer_to_update_symlink_allowlist", True),
     ("sync_confirm_wait", 5),
     ("place_after_open", True),
-    ("do_not_sync", ("EnderChest/enderchest.cfg", "EnderChest/.*", ".DS_Store")),
+    ("do_not_sync", (_CHEST_CFG_EXCLUSION, "EnderChest/.*", ".DS_Store")),
     (
         "shulker_box_folders",
         (
@@ -210,9 +215,10 @@ class EnderChest:
         - If this instance shares a path with an existing instance, it will
           replace that instance
         """
+        minecraft_root = abspath_from_uri(self._uri)
         matching_instances: list[i.InstanceSpec] = []
         for old_instance in self._instances:
-            if i.equals(abspath_from_uri(self._uri), instance, old_instance):
+            if i.equals(minecraft_root, instance, old_instance):
                 matching_instances.append(old_instance)
                 self._instances.remove(old_instance)
 
@@ -377,16 +383,13 @@ class EnderChest:
 
         if do_not_sync is not None:
             ender_chest.do_not_sync = do_not_sync
-            chest_cfg_exclusion = "/".join(
-                (fs.ENDER_CHEST_FOLDER_NAME, fs.ENDER_CHEST_CONFIG_NAME)
-            )
-            if chest_cfg_exclusion not in do_not_sync:
+            if _CHEST_CFG_EXCLUSION not in do_not_sync:
                 INVENTORY_LOGGER.warning(
                     "This EnderChest was not configured to exclude the EnderChest"
                     " config file from sync operations."
                     "\nThat is being fixed now."
                 )
-                ender_chest.do_not_sync.insert(0, chest_cfg_exclusion)
+                ender_chest.do_not_sync.insert(0, _CHEST_CFG_EXCLUSION)
                 requires_rewrite = True
         for setting in folder_defaults:
             if folder_defaults[setting] is None:
@@ -172,7 +172,15 @@ def shulker_box_configs(minecraft_root: Path) -> Iterable[Path]:
     just that they exist
     """
     INVENTORY_LOGGER.debug(f"Searching for shulker configs within {minecraft_root}")
-    return ender_chest_folder(minecraft_root).glob(f"*/{SHULKER_BOX_CONFIG_NAME}")
+    configs: list[Path] = []
+    with os.scandir(ender_chest_folder(minecraft_root)) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            config_path = os.path.join(entry.path, SHULKER_BOX_CONFIG_NAME)
+            if os.path.isfile(config_path):
+                configs.append(Path(config_path))
+    return configs
 
 
 def minecraft_folders(search_path: Path) -> Iterable[Path]:
@@ -196,8 +204,48 @@ def minecraft_folders(search_path: Path) -> Iterable[Path]:
     return search_path.rglob(".minecraft")
 
 
+def symlinks_within(root: Path) -> Iterable[tuple[Path, str]]:
+    """Find all symlinks inside the path, regardless of depth
+
+    Parameters
+    ----------
+    root : Path
+        The path to search
+
+    Yields
+    ------
+    Path
+        Each symlink inside the path
+    str
+        The (unresolved) target of that link
+
+    Notes
+    -----
+    - Like `Path.rglob("*")`, this method does not descend into symlinked
+      directories
+    - Links are identified straight from the directory listings, without
+      needing to `stat` each file, and it's safe to delete links as they're
+      yielded
+    - Directories that can't be read (due to permissions) are silently skipped
+    """
+    directories: list[str | Path] = [root]
+    while directories:
+        try:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.is_symlink():
+                        yield Path(entry.path), os.readlink(entry.path)
+                    elif entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+        except PermissionError:
+            continue
+
+
 def links_into_enderchest(
-    minecraft_root: Path, link: Path, check_exists: bool = True
+    minecraft_root: Path,
+    link: Path,
+    check_exists: bool = True,
+    target: str | None = None,
 ) -> bool:
     """Determine whether a symlink's target is inside the EnderChest specified
     by the Minecraft root.
@@ -214,6 +262,9 @@ def links_into_enderchest(
         at that location (meaning no folder or no enderchest config file in
         that folder). To disable that check, call this method with
         `check_exists=False`.
+    target : str, optional
+        The (unresolved) target of the link, if it's already been read. If
+        this is not provided, the link will be read from the filesystem.
 
     Returns
     -------
@@ -239,7 +290,8 @@ def links_into_enderchest(
         .absolute()
     )
 
-    target = os.readlink(link)
+    if target is None:
+        target = os.readlink(link)
     if not os.path.isabs(target):
         target = os.path.normpath(link.parent / target)
 
@@ -1,10 +1,12 @@
 """Functionality for onboarding and updating new installations and instances"""
 
+import functools
 import itertools
 import json
 import logging
 import os
 import re
+import sys
 from configparser import ConfigParser, ParsingError
 from pathlib import Path
 from typing import Any, Iterable, TypedDict
@@ -13,7 +15,7 @@ from urllib.parse import ParseResult
 from . import filesystem as fs
 from .enderchest import EnderChest, create_ender_chest
 from .instance import InstanceSpec, normalize_modloader, parse_version
-from .inventory import load_ender_chest
+from .inventory import clear_config_cache, load_ender_chest
 from .loggers import GATHER_LOGGER
 from .prompt import prompt
 from .shulker_box import _matches_version
@@ -106,6 +108,38 @@ def gather_minecraft_instances(
     return instances
 
 
+def _load_json(json_file: Path) -> Any:
+    """Read and parse a JSON file in one go
+
+    Parameters
+    ----------
+    json_file : Path
+        The path to the JSON file
+
+    Returns
+    -------
+    Any
+        The parsed contents of the file
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist
+    json.JSONDecodeError
+        If the file could not be parsed
+
+    Notes
+    -----
+    The file is read as raw bytes and handed straight to the parser rather
+    than being streamed through a text-mode file handle
+    """
+    return json.loads(json_file.read_bytes())
+
+
+_LATEST_PREFIX = "latest-"
+_LATEST_PREFIX_LENGTH = len(_LATEST_PREFIX)
+
+
 def gather_metadata_for_official_instance(
     minecraft_folder: Path, name: str = "official"
 ) -> InstanceSpec:
@@ -138,8 +172,7 @@ def gather_metadata_for_official_instance(
     """
     launcher_profile_file = minecraft_folder / "launcher_profiles.json"
     try:
-        with launcher_profile_file.open() as lp_json:
-            launcher_profiles = json.load(lp_json)
+        launcher_profiles = _load_json(launcher_profile_file)
         raw_versions: list[str] = [
             profile["lastVersionId"]
             for profile in launcher_profiles["profiles"].values()
@@ -157,8 +190,7 @@ def gather_metadata_for_official_instance(
 
     version_manifest_file = minecraft_folder / "versions" / "version_manifest_v2.json"
     try:
-        with version_manifest_file.open() as vm_json:
-            version_lookup: dict[str, str] = json.load(vm_json)["latest"]
+        version_lookup: dict[str, str] = _load_json(version_manifest_file)["latest"]
     except FileNotFoundError as no_json:
         raise ValueError(f"Could not find {version_manifest_file}") from no_json
     except json.JSONDecodeError as bad_json:
@@ -172,20 +204,41 @@ def gather_metadata_for_official_instance(
         )
         version_lookup = {}
 
-    versions: list[str] = []
-    groups: list[str] = ["vanilla"]
-    for version in raw_versions:
-        if version.startswith("latest-"):
-            mapped_version = version_lookup.get(version[len("latest-") :])
-            if mapped_version is not None:
-                versions.append(parse_version(mapped_version))
-                groups.append(version)
-                continue
-        versions.append(parse_version(version))
+    # pair each version with the release it's an alias of (if any)
+    mapped_versions: list[tuple[str | None, str]] = [
+        (
+            (
+                version_lookup.get(version[_LATEST_PREFIX_LENGTH:])
+                if version.startswith(_LATEST_PREFIX)
+                else None
+            ),
+            version,
+        )
+        for version in raw_versions
+    ]
+    versions: list[str] = [
+        parse_version(version if mapped_version is None else mapped_version)
+        for mapped_version, version in mapped_versions
+    ]
+    groups: list[str] = [
+        "vanilla",
+        *(
+            version
+            for mapped_version, version in mapped_versions
+            if mapped_version is not None
+        ),
+    ]
 
     return InstanceSpec(name, minecraft_folder, tuple(versions), "", tuple(groups), ())
 
 
+_MMC_MODLOADER_COMPONENTS: dict[str, str] = {
+    "net.fabricmc.fabric-loader": "Fabric Loader",
+    "org.quiltmc.quilt-loader": "Quilt Loader",
+    "net.minecraftforge": "Forge",
+}
+
+
 def gather_metadata_for_mmc_instance(
     minecraft_folder: Path, instgroups_file: Path | None = None
 ) -> InstanceSpec:
@@ -216,26 +269,22 @@ def gather_metadata_for_mmc_instance(
     """
     mmc_pack_file = minecraft_folder.parent / "mmc-pack.json"
     try:
-        with mmc_pack_file.open() as mmc_json:
-            components: list[dict] = json.load(mmc_json)["components"]
+        components: list[dict] = _load_json(mmc_pack_file)["components"]
 
         version: str | None = None
         modloader: str | None = None
 
         for component in components:
-            match component.get("uid"), component.get("cachedName", ""):
-                case "net.minecraft", _:
-                    version = parse_version(component["version"])
-                case "net.fabricmc.fabric-loader", _:
-                    modloader = "Fabric Loader"
-                case "org.quiltmc.quilt-loader", _:
-                    modloader = "Quilt Loader"
-                case ("net.minecraftforge", _) | (_, "Forge"):
-                    modloader = "Forge"
-                case _, name if name.endswith("oader"):
-                    modloader = name
-                case _:
-                    continue
+            uid, cached_name = component.get("uid"), component.get("cachedName", "")
+            if uid == "net.minecraft":
+                version = parse_version(component["version"])
+                continue
+            if uid in _MMC_MODLOADER_COMPONENTS:
+                modloader = _MMC_MODLOADER_COMPONENTS[uid]
+            elif cached_name == "Forge" or cached_name.endswith("oader"):
+                modloader = cached_name
+            else:
+                continue
             modloader = normalize_modloader(modloader)[0]
         if version is None:
             raise KeyError("Could not find a net.minecraft component")
@@ -265,12 +314,11 @@ def gather_metadata_for_mmc_instance(
         )
 
         try:
-            with instgroups_file.open() as groups_json:
-                groups: dict[str, dict] = json.load(groups_json)["groups"]
+            groups: dict[str, dict] = _load_json(instgroups_file)["groups"]
             for group, metadata in groups.items():
                 # interestingly this comes from the folder name, not the actual name
                 if name in metadata.get("instances", ()):
-                    instance_groups.append(group)
+                    instance_groups.append(sys.intern(group))
 
         except FileNotFoundError as no_json:
             GATHER_LOGGER.warning(
@@ -433,7 +481,7 @@ def gather_metadata_for_minecraft_server(
     else:
         GATHER_LOGGER.warning(
             "Could not parse server metadata from:\n%s",
-            "\n".join((f"  - {jar}" for jar in failed_parses)),
+            "\n".join([f"  - {jar}" for jar in failed_parses]),
         )
     if "modloader" not in instance_spec:
         instance_spec["modloader"] = normalize_modloader(
@@ -553,6 +601,7 @@ def update_ender_chest(
             GATHER_LOGGER.warning(bad_remote)
 
     create_ender_chest(minecraft_root, ender_chest)
+    clear_config_cache()
 
 
 def _check_for_allowed_symlinks(
@@ -617,6 +666,10 @@ Read more: https://help.minecraft.net/hc/en-us/articles/16165590199181"""
     GATHER_LOGGER.info(f"{symlink_allowlist} updated.")
 
 
+_SNAPSHOT_VERSION = re.compile("^([1-2][0-9])w([0-9]{1,2})")
+
+
+@functools.cache
 def _needs_symlink_allowlist(version: str) -> bool:
     """Determine if a version needs `allowed_symlinks.txt` in order to link
     to EnderChest. Note that this is going a little broader than is strictly
@@ -635,16 +688,19 @@ def _needs_symlink_allowlist(version: str) -> bool:
 
     Notes
     -----
-    Have I mentioned that parsing Minecraft version strings is a pain in the
-    toucans?
+    - Have I mentioned that parsing Minecraft version strings is a pain in the
+      toucans?
+    - Results are cached, as official instances will typically report the
+      same handful of versions over and over again
     """
     # first see if it follows basic semver
-    if _matches_version(">1.19", parse_version(version.split("-")[0])):
+    release = parse_version(version.split("-")[0])
+    if _matches_version(">1.19", release):
         return True
-    if _matches_version("1.20.0*", parse_version(version.split("-")[0])):
+    if _matches_version("1.20.0*", release):
         return True
     # is it a snapshot?
-    if match := re.match("^([1-2][0-9])w([0-9]{1,2})", version.lower()):
+    if match := _SNAPSHOT_VERSION.match(version.lower()):
         year, week = match.groups()
         if int(year) > 23:
             return True
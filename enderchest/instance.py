@@ -1,6 +1,7 @@
 """Specification of a Minecraft instance"""
 
 import re
+import sys
 from configparser import SectionProxy
 from pathlib import Path
 from typing import NamedTuple
@@ -55,19 +56,24 @@ class InstanceSpec(NamedTuple):
             If a required key is absent
         ValueError
             If a required entry cannot be parsed
+
+        Notes
+        -----
+        Versions, modloaders and tags are drawn from a small vocabulary that's
+        shared across instances, so they're interned on read-in
         """
         return cls(
             section.name,
             Path(section["root"]),
             tuple(
-                parse_version(version.strip())
+                sys.intern(parse_version(version.strip()))
                 for version in cfg.parse_ini_list(
                     section.get("minecraft-version", section.get("minecraft_version"))
                 )
             ),
-            normalize_modloader(section.get("modloader", None))[0],
-            tuple(cfg.parse_ini_list(section.get("groups", ""))),
-            tuple(cfg.parse_ini_list(section.get("tags", ""))),
+            sys.intern(normalize_modloader(section.get("modloader", None))[0]),
+            tuple(map(sys.intern, cfg.parse_ini_list(section.get("groups", "")))),
+            tuple(map(sys.intern, cfg.parse_ini_list(section.get("tags", "")))),
         )
 
     @property
@@ -75,6 +81,20 @@ class InstanceSpec(NamedTuple):
         return tuple(sorted({*self.groups_, *self.tags_}))
 
 
+_MODLOADER_DELIMITERS = str.maketrans("", "", " -_/")
+
+_MODLOADER_ALIASES: dict[str, tuple[str, ...]] = {
+    **dict.fromkeys(("none", "vanilla", "minecraftserver"), ("",)),
+    **dict.fromkeys(("fabric", "fabricloader"), ("Fabric Loader",)),
+    **dict.fromkeys(("quilt", "quiltloader"), ("Quilt Loader",)),
+    **dict.fromkeys(
+        ("fabricquilt", "quiltfabric", "fabriclike", "fabriccompatible"),
+        ("Fabric Loader", "Quilt Loader"),
+    ),
+    **dict.fromkeys(("forge", "forgeloader", "minecraftforge"), ("Forge",)),
+}
+
+
 def normalize_modloader(loader: str | None) -> list[str]:
     """Implement common modloader aliases
 
@@ -91,21 +111,11 @@ def normalize_modloader(loader: str | None) -> list[str]:
     """
     if loader is None:  # this would be from the instance spec
         return [""]
-    match loader.lower().replace(" ", "").replace("-", "").replace("_", "").replace(
-        "/", ""
-    ):
-        case "none" | "vanilla" | "minecraftserver":
-            return [""]
-        case "fabric" | "fabricloader":
-            return ["Fabric Loader"]
-        case "quilt" | "quiltloader":
-            return ["Quilt Loader"]
-        case "fabricquilt" | "quiltfabric" | "fabriclike" | "fabriccompatible":
-            return ["Fabric Loader", "Quilt Loader"]
-        case "forge" | "forgeloader" | "minecraftforge":
-            return ["Forge"]
-        case _:
-            return [loader.title()]
+    return list(
+        _MODLOADER_ALIASES.get(
+            loader.lower().translate(_MODLOADER_DELIMITERS), (loader.title(),)
+        )
+    )
 
 
 def equals(
@@ -128,9 +138,15 @@ def equals(
         True if and only if the two instances have the same root, with regards
         to the provided `minecraft_root`
     """
+    minecraft_root = minecraft_root.expanduser()
     path = minecraft_root / instance.root.expanduser()
     other_path = minecraft_root / other_instance.root.expanduser()
-    return path.expanduser().resolve() == other_path.expanduser().resolve()
+    if path == other_path:  # no need to hit the filesystem
+        return True
+    return path.resolve() == other_path.resolve()
+
+
+_MAJOR_MINOR_VERSION = re.compile(r"^(0|[1-9]\d*)\.(0|[1-9]\d*)$")
 
 
 def parse_version(version_string: str) -> str:
@@ -153,7 +169,7 @@ def parse_version(version_string: str) -> str:
     -----
     Regex adapted straight from https://semver.org
     """
-    if re.match(r"^(0|[1-9]\d*)\.(0|[1-9]\d*)$", version_string):
+    if _MAJOR_MINOR_VERSION.match(version_string):
         return version_string + ".0"
     return version_string
 
@@ -1,5 +1,6 @@
 """Functionality for resolving EnderChest and shulker box states"""
 
+import copy
 import logging
 from pathlib import Path
 from typing import Iterable, Sequence
@@ -11,6 +12,40 @@ from . import EnderChest, InstanceSpec, ShulkerBox
 from . import filesystem as fs
 from .loggers import INVENTORY_LOGGER
 
+# parsed configs, keyed by (absolute path, mtime in ns, size in bytes)
+_ENDER_CHEST_CACHE: dict[tuple[str, int, int], EnderChest] = {}
+_SHULKER_BOX_CACHE: dict[tuple[str, int, int], ShulkerBox] = {}
+
+
+def _config_cache_key(config_file: Path) -> tuple[str, int, int]:
+    """Generate a key for looking up a parsed config file that will change
+    whenever the file itself does
+
+    Parameters
+    ----------
+    config_file : Path
+        The path to the config file
+
+    Returns
+    -------
+    tuple of (str, int, int)
+        The absolute path to the file, its modification time (in nanoseconds)
+        and its size
+
+    Raises
+    ------
+    FileNotFoundError
+        If there is no file at the specified location
+    """
+    stats = config_file.stat()
+    return str(config_file.absolute()), stats.st_mtime_ns, stats.st_size
+
+
+def clear_config_cache() -> None:
+    """Forget all previously parsed EnderChest and shulker box configs"""
+    _ENDER_CHEST_CACHE.clear()
+    _SHULKER_BOX_CACHE.clear()
+
 
 def load_ender_chest(minecraft_root: Path) -> EnderChest:
     """Load the configuration from the enderchest.cfg file in the EnderChest
@@ -34,12 +69,19 @@ def load_ender_chest(minecraft_root: Path) -> EnderChest:
         enderchest.cfg file exists within that EnderChest folder
     ValueError
         If the EnderChest configuration is invalid and could not be parsed
+
+    Notes
+    -----
+    Parsed configs are cached for as long as the config file is unmodified
     """
     config_path = fs.ender_chest_config(minecraft_root)
-    INVENTORY_LOGGER.debug(f"Loading {config_path}")
-    ender_chest = EnderChest.from_cfg(config_path)
-    INVENTORY_LOGGER.debug(f"Parsed EnderChest installation from {minecraft_root}")
-    return ender_chest
+    cache_key = _config_cache_key(config_path)
+    if cache_key not in _ENDER_CHEST_CACHE:
+        INVENTORY_LOGGER.debug(f"Loading {config_path}")
+        _ENDER_CHEST_CACHE[cache_key] = EnderChest.from_cfg(config_path)
+        INVENTORY_LOGGER.debug(f"Parsed EnderChest installation from {minecraft_root}")
+    # EnderChests are mutable, so don't hand out the cached one
+    return copy.deepcopy(_ENDER_CHEST_CACHE[cache_key])
 
 
 def load_ender_chest_instances(
@@ -86,12 +128,7 @@ def load_ender_chest_instances(
             log_level,
             "These are the instances that are currently registered"
             f" to the {minecraft_root} EnderChest:\n%s",
-            "\n".join(
-                [
-                    f"  {i + 1}. {render_instance(instance)}"
-                    for i, instance in enumerate(instances)
-                ]
-            ),
+            _InstanceListing(instances),
         )
     return instances
 
@@ -112,6 +149,28 @@ def render_instance(instance: InstanceSpec) -> str:
     return f"{instance.name} ({instance.root})"
 
 
+class _InstanceListing:
+    """A numbered listing of instances that's only rendered if and when it's
+    actually logged
+
+    Parameters
+    ----------
+    instances : list of InstanceSpec
+        The instances to list
+    """
+
+    def __init__(self, instances: Sequence[InstanceSpec]):
+        self.instances = instances
+
+    def __str__(self) -> str:
+        return "\n".join(
+            [
+                f"  {i + 1}. {render_instance(instance)}"
+                for i, instance in enumerate(self.instances)
+            ]
+        )
+
+
 def load_shulker_boxes(
     minecraft_root: Path, log_level: int = logging.INFO
 ) -> list[ShulkerBox]:
@@ -175,13 +234,17 @@ def report_shulker_boxes(
     shulker_boxes: Iterable[ShulkerBox], log_level: int, ender_chest_name: str
 ) -> None:
     """Log the list of shulker boxes in the order they'll be linked"""
+    if not INVENTORY_LOGGER.isEnabledFor(log_level):
+        return
     INVENTORY_LOGGER.log(
         log_level,
         f"These are the shulker boxes within {ender_chest_name}"
         "\nlisted in the order in which they are linked:\n%s",
         "\n".join(
-            f"  {shulker_box.priority}. {_render_shulker_box(shulker_box)}"
-            for shulker_box in shulker_boxes
+            [
+                f"  {shulker_box.priority}. {_render_shulker_box(shulker_box)}"
+                for shulker_box in shulker_boxes
+            ]
         ),
     )
 
@@ -206,11 +269,21 @@ def _load_shulker_box(config_file: Path) -> ShulkerBox:
         If the given config file could not be found
     ValueError
         If there was a problem parsing the config file
+
+    Notes
+    -----
+    Parsed configs are cached for as long as the config file is unmodified
     """
-    INVENTORY_LOGGER.debug(f"Attempting to parse {config_file}")
-    shulker_box = ShulkerBox.from_cfg(config_file)
-    INVENTORY_LOGGER.debug(f"Successfully parsed {_render_shulker_box(shulker_box)}")
-    return shulker_box
+    cache_key = _config_cache_key(config_file)
+    if cache_key not in _SHULKER_BOX_CACHE:
+        INVENTORY_LOGGER.debug(f"Attempting to parse {config_file}")
+        shulker_box = ShulkerBox.from_cfg(config_file)
+        INVENTORY_LOGGER.debug(
+            f"Successfully parsed {_render_shulker_box(shulker_box)}"
+        )
+        _SHULKER_BOX_CACHE[cache_key] = shulker_box
+    # the same file may have been reached via a different (e.g. relative) path
+    return _SHULKER_BOX_CACHE[cache_key]._replace(root=config_file.parent)
 
 
 def _render_shulker_box(shulker_box: ShulkerBox) -> str:
@@ -227,11 +300,11 @@ def _render_shulker_box(shulker_box: ShulkerBox) -> str:
         {priority}. {folder_name} [({name})]
             (if different from folder name)
     """
-    stringified = f"{shulker_box.root.name}"
-    if shulker_box.root.name != shulker_box.name:  # pragma: no cover
+    folder_name = shulker_box.root.name
+    if folder_name != shulker_box.name:  # pragma: no cover
         # note: this is not a thing
-        stringified += f" ({shulker_box.name})"
-    return stringified
+        return f"{folder_name} ({shulker_box.name})"
+    return folder_name
 
 
 def load_ender_chest_remotes(
@@ -276,16 +349,18 @@ def load_ender_chest_remotes(
             )
         return []
 
+    remote_list: list[tuple[ParseResult, str]] = list(remotes)
+    if not INVENTORY_LOGGER.isEnabledFor(log_level):
+        return remote_list
+
     report = (
         "These are the remote EnderChest installations registered"
         f" to the one installed at {minecraft_root}"
     )
-    remote_list: list[tuple[ParseResult, str]] = []
     log_args: list[str] = []
-    for remote, alias in remotes:
+    for remote, alias in remote_list:
         report += "\n  - %s"
         log_args.append(render_remote(alias, remote))
-        remote_list.append((remote, alias))
     INVENTORY_LOGGER.log(log_level, report, *log_args)
     return remote_list
 
@@ -324,17 +399,19 @@ def get_shulker_boxes_matching_instance(
         )
         return []
 
+    host = chest.name
+    # the host check doesn't depend on the instance and is the cheaper of the two
     matches = [
         box
         for box in load_shulker_boxes(minecraft_root, log_level=logging.DEBUG)
-        if box.matches(mc) and box.matches_host(chest.name)
+        if box.matches_host(host) and box.matches(mc)
     ]
 
     if len(matches) == 0:
         report = "does not link to any shulker boxes in this chest"
     else:
         report = "links to the following shulker boxes:\n" + "\n".join(
-            f"  - {_render_shulker_box(box)}" for box in matches
+            [f"  - {_render_shulker_box(box)}" for box in matches]
         )
 
     INVENTORY_LOGGER.info(f"The instance {render_instance(mc)} {report}")
@@ -392,12 +469,7 @@ def get_instances_matching_shulker_box(
     INVENTORY_LOGGER.debug(
         "These are the instances that are currently registered"
         f" to the {minecraft_root} EnderChest:\n%s",
-        "\n".join(
-            [
-                f"  {i + 1}. {render_instance(instance)}"
-                for i, instance in enumerate(chest.instances)
-            ]
-        ),
+        _InstanceListing(chest.instances),
     )
 
     matches = [
@@ -408,7 +480,7 @@ def get_instances_matching_shulker_box(
         report = "is not linked to by any registered instances"
     else:
         report = "is linked to by the following instances:\n" + "\n".join(
-            f"  - {render_instance(instance)}" for instance in matches
+            [f"  - {render_instance(instance)}" for instance in matches]
         )
 
     INVENTORY_LOGGER.info(
@@ -32,8 +32,18 @@ class CLIFormatter(logging.Formatter):
         logging.CRITICAL: bold_red + "%(message)s" + reset,
     }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # build each formatter once rather than once per record
+        self._formatters = {
+            level: logging.Formatter(fmt) for level, fmt in self.FORMATS.items()
+        }
+        self._default_formatter = logging.Formatter()
+
     def format(self, record: logging.LogRecord) -> str:
-        return logging.Formatter(self.FORMATS.get(record.levelno)).format(record)
+        return self._formatters.get(record.levelno, self._default_formatter).format(
+            record
+        )
 
 
 def verbosity_to_log_level(verbosity: int) -> int:
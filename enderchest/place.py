@@ -1,15 +1,20 @@
 """Symlinking functionality"""
 
 import fnmatch
+import functools
 import itertools
 import json
 import logging
 import os
+import re
+import stat
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Collection, Iterable, Sequence
 
 from . import filesystem as fs
+from .instance import InstanceSpec
 from .inventory import load_ender_chest, load_ender_chest_instances, load_shulker_boxes
 from .loggers import IMPORTANT, INVENTORY_LOGGER, PLACE_LOGGER
 from .prompt import prompt
@@ -90,6 +95,10 @@ def place_ender_chest(
       the `keep_broken_links` argument
     - If the placement is aborted (`error_handling="abort"` or "Abort" selected
       from prompt) then the returned placements will be empty
+    - When `error_handling="ignore"`, the files inside each shulker box are
+      linked into each instance concurrently (since no failure can stop the
+      linking early). Otherwise they're linked one at a time, so that nothing
+      gets linked past the point where the linking was stopped
     """
     placements: dict[str, dict[Path, list[str]]] = {}
 
@@ -107,6 +116,12 @@ def place_ender_chest(
     instances = load_ender_chest_instances(minecraft_root, log_level=logging.DEBUG)
 
     shulker_boxes: list[ShulkerBox] = []
+    # resolved once up front rather than once per instance
+    box_roots: dict[str, Path] = {}
+    link_folder_paths: dict[str, set[Path]] = {}
+    # the contents of a shulker box don't depend on the instance it's being
+    # linked into, so each box only gets scanned once
+    box_contents: dict[str, list[tuple[Path, bool]]] = {}
 
     for shulker_box in load_shulker_boxes(minecraft_root, log_level=logging.DEBUG):
         if not shulker_box.matches_host(host):
@@ -115,6 +130,11 @@ def place_ender_chest(
             )
             continue
         shulker_boxes.append(shulker_box)
+        box_root = shulker_box.root.expanduser().absolute()
+        box_roots[shulker_box.name] = box_root
+        link_folder_paths[shulker_box.name] = {
+            box_root / link_folder for link_folder in shulker_box.link_folders
+        }
 
     skip_boxes: list[ShulkerBox] = []
 
@@ -137,34 +157,35 @@ def place_ender_chest(
               - pass
         """
         if error_handling == "prompt":
-            proceed_how = (
-                prompt(
-                    "How would you like to proceed?"
-                    "\n[Q]uit; [R]etry; [C]ontinue; skip linking the rest of this:"
-                    "\n[I]nstance, [S]hulker box, shulker/instance [M]atch?",
-                    suggestion="R",
+            proceed_how = ""
+            while not proceed_how:
+                selection = (
+                    prompt(
+                        "How would you like to proceed?"
+                        "\n[Q]uit; [R]etry; [C]ontinue; skip linking the rest of this:"
+                        "\n[I]nstance, [S]hulker box, shulker/instance [M]atch?",
+                        suggestion="R",
+                    )
+                    .lower()
+                    .replace(" ", "")
+                    .replace("-", "")
+                    .replace("_", "")
                 )
-                .lower()
-                .replace(" ", "")
-                .replace("-", "")
-                .replace("_", "")
-            )
-            match proceed_how:
-                case "" | "r":
-                    proceed_how = "retry"
-                case "" | "i" | "instance" | "skipinstance":
-                    proceed_how = "skip-instance"
-                case "q" | "quit" | "abort" | "exit" | "stop":
-                    proceed_how = "abort"
-                case "c" | "continue" | "ignore":
-                    proceed_how = "ignore"
-                case "m" | "match" | "skip":
-                    proceed_how = "skip"
-                case "s" | "shulker" | "shulkerbox" | "skipshulker":
-                    proceed_how = "skip-shulker"
-                case _:
-                    PLACE_LOGGER.error("Invalid selection.")
-                    return handle_error(shulker_box)
+                match selection:
+                    case "" | "r":
+                        proceed_how = "retry"
+                    case "" | "i" | "instance" | "skipinstance":
+                        proceed_how = "skip-instance"
+                    case "q" | "quit" | "abort" | "exit" | "stop":
+                        proceed_how = "abort"
+                    case "c" | "continue" | "ignore":
+                        proceed_how = "ignore"
+                    case "m" | "match" | "skip":
+                        proceed_how = "skip"
+                    case "s" | "shulker" | "shulkerbox" | "skipshulker":
+                        proceed_how = "skip-shulker"
+                    case _:
+                        PLACE_LOGGER.error("Invalid selection.")
         else:
             proceed_how = error_handling
 
@@ -195,8 +216,13 @@ def place_ender_chest(
                 )
 
     for instance in instances:
-        instance_root = (minecraft_root / instance.root.expanduser()).expanduser()
-        placements[instance.name] = defaultdict(list)
+        instance_root = (
+            (minecraft_root / instance.root.expanduser()).expanduser().absolute()
+        )
+        instance_placements: dict[Path, list[str]] = defaultdict(list)
+        placements[instance.name] = instance_placements
+        # folders inside the instance that are known to already exist
+        instance_folders: set[str] = set()
 
         handling: str | None = "retry"
         while handling == "retry":
@@ -204,10 +230,7 @@ def place_ender_chest(
                 handling = None
                 break
 
-            PLACE_LOGGER.error(
-                "No minecraft instance exists at"
-                f" {instance_root.expanduser().absolute()}"
-            )
+            PLACE_LOGGER.error(f"No minecraft instance exists at {instance_root}")
             handling = handle_error(None)
         if handling is not None:
             match handling:
@@ -220,38 +243,40 @@ def place_ender_chest(
 
         # start by removing all existing symlinks into the EnderChest
         if not keep_stale_links:
-            for file in instance_root.rglob("*"):
-                if file.is_symlink():
-                    if fs.links_into_enderchest(minecraft_root, file):
-                        PLACE_LOGGER.debug(
-                            f"Removing old link: {file} -> {os.readlink(file)}"
-                        )
-                        file.unlink()
+            for file, target in fs.symlinks_within(instance_root):
+                # the EnderChest was already loaded above, so there's no need
+                # to keep checking that it exists
+                if fs.links_into_enderchest(
+                    minecraft_root, file, check_exists=False, target=target
+                ):
+                    PLACE_LOGGER.debug("Removing old link: %s -> %s", file, target)
+                    file.unlink()
 
         for shulker_box in shulker_boxes:
-            if not shulker_box.matches(instance):
-                continue
+            # checking the skip list is much cheaper than evaluating the match
             if shulker_box in skip_boxes:
                 continue
+            if not shulker_box.matches(instance):
+                continue
 
-            box_root = shulker_box.root.expanduser().absolute()
+            box_root = box_roots[shulker_box.name]
 
             PLACE_LOGGER.info(f"Linking {instance.root} to {shulker_box.name}")
 
-            resources = set(_rglob(box_root, shulker_box.max_link_depth))
-
             match_exit = "pass"
             for link_folder in shulker_box.link_folders:
-                resources -= {box_root / link_folder}
-                resources -= set((box_root / link_folder).rglob("*"))
-
                 handling = "retry"
                 while handling == "retry":
                     try:
-                        link_resource(link_folder, box_root, instance_root, relative)
-                        placements[instance.name][Path(link_folder)].append(
-                            shulker_box.name
+                        link_resource(
+                            link_folder,
+                            box_root,
+                            instance_root,
+                            relative,
+                            target_is_directory=True,  # by definition
+                            existing_folders=instance_folders,
                         )
+                        instance_placements[Path(link_folder)].append(shulker_box.name)
                         handling = None
                     except OSError:
                         PLACE_LOGGER.error(
@@ -275,61 +300,77 @@ def place_ender_chest(
                             continue  # or pass--it's the end of the loop
 
             if match_exit not in ("break", "continue"):
-                for resource in resources:
-                    resource_path = resource.relative_to(box_root)
-                    for pattern in shulker_box.do_not_link:
-                        if fnmatch.fnmatchcase(
-                            str(resource_path), pattern
-                        ) or fnmatch.fnmatchcase(
-                            str(resource_path), os.path.join("*", pattern)
-                        ):
-                            PLACE_LOGGER.debug(
-                                "Skipping %s (matches pattern %s)",
-                                resource_path,
-                                pattern,
-                            )
-                            break
-                    else:
-                        handling = "retry"
-                        while handling == "retry":
-                            try:
-                                link_resource(
-                                    resource_path,
-                                    box_root,
-                                    instance_root,
-                                    relative,
-                                )
-                                placements[instance.name][resource_path].append(
-                                    shulker_box.name
-                                )
-                                handling = None
-                            except OSError:
-                                PLACE_LOGGER.error(
-                                    f"Error linking shulker box {shulker_box.name}"
-                                    f" to instance {instance.name}:"
-                                    f"\n  {(instance.root / resource_path)}"
-                                    " already exists"
-                                )
-                                handling = handle_error(shulker_box)
-                        if handling is not None:
-                            match handling:
-                                case "return":
-                                    return placements
-                                case "break":
-                                    match_exit = "break"
-                                    break
-                                case "continue":
-                                    match_exit = "continue"  # technically does nothing
-                                    break
-                                case "pass":
-                                    continue  # or pass--it's the end of the loop
+                if shulker_box.name not in box_contents:
+                    box_contents[shulker_box.name] = _list_linkable_resources(
+                        shulker_box, box_root, link_folder_paths[shulker_box.name]
+                    )
+                linkable = box_contents[shulker_box.name]
+
+                def attempt_link(resource: tuple[Path, bool]) -> bool:
+                    """Link the resource, reporting whether it was successful"""
+                    resource_path, is_directory = resource
+                    try:
+                        link_resource(
+                            resource_path,
+                            box_root,
+                            instance_root,
+                            relative,
+                            target_is_directory=is_directory,
+                            existing_folders=instance_folders,
+                        )
+                        return True
+                    except OSError:
+                        return False
+
+                linked: Iterable[bool]
+                if error_handling == "ignore":
+                    # every link is independent and the work is almost entirely
+                    # syscalls, so when no failure can stop the linking early,
+                    # make every first attempt concurrently
+                    with ThreadPoolExecutor() as executor:
+                        linked = list(executor.map(attempt_link, linkable))
+                else:
+                    # lazily, so that nothing gets linked past a failure that
+                    # ends up stopping the linking
+                    linked = map(attempt_link, linkable)
+
+                for resource, success in zip(linkable, linked):
+                    resource_path = resource[0]
+                    handling = None if success else "retry"
+                    while handling == "retry":
+                        PLACE_LOGGER.error(
+                            f"Error linking shulker box {shulker_box.name}"
+                            f" to instance {instance.name}:"
+                            f"\n  {(instance.root / resource_path)}"
+                            " already exists"
+                        )
+                        handling = handle_error(shulker_box)
+                        if handling == "retry" and attempt_link(resource):
+                            success = True
+                            handling = None
+                    if success:
+                        instance_placements[resource_path].append(shulker_box.name)
+                    if handling is not None:
+                        match handling:
+                            case "return":
+                                return placements
+                            case "break":
+                                match_exit = "break"
+                                break
+                            case "continue":
+                                match_exit = "continue"  # technically does nothing
+                                break
+                            case "pass":
+                                continue  # or pass--it's the end of the loop
 
             # consider this a "finally"
             if not keep_broken_links:
-                # we clean up as we go, just in case of a failure
-                for file in instance_root.rglob("*"):
+                # we clean up as we go, both in case of a failure and because a
+                # broken link (say, to a missing link folder) can sit right
+                # where a later shulker box needs a real folder
+                for file, _ in fs.symlinks_within(instance_root):
                     if not file.exists():
-                        PLACE_LOGGER.debug(f"Removing broken link: {file}")
+                        PLACE_LOGGER.debug("Removing broken link: %s", file)
                         file.unlink()
 
             if match_exit == "break":
@@ -342,6 +383,8 @@ def link_resource(
     shulker_root: Path,
     instance_root: Path,
     relative: bool,
+    target_is_directory: bool | None = None,
+    existing_folders: set[str] | None = None,
 ) -> None:
     """Create a symlink for the specified resource from an instance's space
     pointing to the tagged file / folder living inside a shulker box.
@@ -358,6 +401,16 @@ def link_resource(
         If True, the link will be use a relative path if possible. Otherwise,
         an absolute path will be used, regardless of whether a relative or
         absolute path was provided.
+    target_is_directory : bool, optional
+        Whether the resource being linked to is a directory. This only matters
+        on Windows, and if it is not provided (and is needed), it will be
+        determined by checking the resource itself.
+    existing_folders : set of str, optional
+        The (absolute) paths of folders that are already known to exist. If
+        provided, this method will skip creating the link's parent folder if
+        it's in this set and will otherwise keep the set up to date. Callers
+        placing many links into the same instance can use this to avoid
+        repeatedly checking for the same folders.
 
     Raises
     ------
@@ -371,35 +424,189 @@ def link_resource(
     - This method will overwrite existing symlinks and empty folders
       but will not overwrite or delete any actual files.
     """
-    instance_path = (instance_root / resource_path).expanduser().absolute()
-    instance_path.parent.mkdir(parents=True, exist_ok=True)
-
-    target: str | Path = (shulker_root / resource_path).expanduser().absolute()
+    # callers linking many resources should pass in absolute roots so that
+    # this only needs to happen once
+    if not instance_root.is_absolute():
+        instance_root = instance_root.expanduser().absolute()
+    if not shulker_root.is_absolute():
+        shulker_root = shulker_root.expanduser().absolute()
+
+    # everything from here on is done with plain strings, as building Path
+    # objects for every link adds up
+    instance_path = os.path.normpath(os.path.join(instance_root, resource_path))
+    instance_folder = os.path.dirname(instance_path)
+    if existing_folders is None or instance_folder not in existing_folders:
+        os.makedirs(instance_folder, exist_ok=True)
+        if existing_folders is not None:
+            existing_folders.add(instance_folder)
+
+    source = os.path.join(shulker_root, resource_path)
     if relative:
-        target = os.path.relpath(target, instance_path.parent)
+        resource = os.path.normpath(resource_path)
+        box_from_instance = _relative_box_root(
+            os.fspath(shulker_root), os.fspath(instance_root)
+        )
+        if box_from_instance is None or resource.startswith(os.pardir):
+            target = os.path.relpath(source, instance_folder)
+        else:
+            # climb out of the resource's parent folders, then use the
+            # (cached) path from the instance root into the shulker box
+            climb = (os.pardir + os.sep) * resource.count(os.sep)
+            target = climb + os.path.join(box_from_instance, resource)
     else:
-        target = target.resolve()  # type: ignore
+        target = os.path.realpath(source)
+
+    if target_is_directory is None:
+        # the flag is ignored on every OS other than Windows, so skip the stat
+        target_is_directory = os.name == "nt" and os.path.isdir(source)
 
-    if instance_path.is_symlink():
+    PLACE_LOGGER.debug("Linking %s to %s", instance_path, target)
+    try:
+        # most of the time there won't be anything in the way
+        os.symlink(target, instance_path, target_is_directory=target_is_directory)
+        return
+    except FileExistsError:
+        pass
+
+    existing_mode = os.lstat(instance_path).st_mode
+    if existing_folders is not None:
+        existing_folders.discard(instance_path)
+    if stat.S_ISLNK(existing_mode) and os.name != "nt":
+        # swap the new link in over the previous one so that there's never a
+        # moment where nothing is there (Windows won't rename over links to
+        # directories, so there it's handled below instead)
+        temp_path = os.path.join(
+            instance_folder,
+            f".{os.path.basename(instance_path)}.{os.getpid()}.enderchest-tmp",
+        )
+        os.symlink(target, temp_path, target_is_directory=target_is_directory)
+        try:
+            os.replace(temp_path, instance_path)
+        except OSError:
+            os.unlink(temp_path)
+            raise
+        PLACE_LOGGER.debug("Replaced previous link at %s", instance_path)
+        return
+    if stat.S_ISLNK(existing_mode):
         # remove previous symlink in this spot
-        instance_path.unlink()
+        os.unlink(instance_path)
         PLACE_LOGGER.debug("Removed previous link at %s", instance_path)
-    else:
-        try:
-            os.rmdir(instance_path)
-            PLACE_LOGGER.debug("Removed empty directory at %s", instance_path)
-        except FileNotFoundError:
-            pass  # A-OK
+    elif stat.S_ISDIR(existing_mode):
+        # this will raise an OSError if the directory isn't empty
+        os.rmdir(instance_path)
+        PLACE_LOGGER.debug("Removed empty directory at %s", instance_path)
+    # and if there's a file in the way, os.symlink will raise the error for us
 
-    PLACE_LOGGER.debug("Linking %s to %s", instance_path, target)
-    os.symlink(
-        target,
-        instance_path,
-        target_is_directory=(shulker_root / resource_path).is_dir(),
+    os.symlink(target, instance_path, target_is_directory=target_is_directory)
+
+
+@functools.cache
+def _relative_box_root(shulker_root: str, instance_root: str) -> str | None:
+    """Find the relative path from an instance to a shulker box, for the sake
+    of building relative links without having to run `os.path.relpath` for
+    every resource
+
+    Parameters
+    ----------
+    shulker_root : str
+        The path to the shulker box
+    instance_root : str
+        The path to the instance's ".minecraft" folder
+
+    Returns
+    -------
+    str or None
+        The path to the shulker box, relative to the instance root, or None
+        if one of the folders is inside the other (or if they're on different
+        drives), in which case the links' relative paths need to be computed
+        individually
+    """
+    shulker_root = os.path.abspath(shulker_root)
+    instance_root = os.path.abspath(instance_root)
+    try:
+        common_root = os.path.commonpath((shulker_root, instance_root))
+    except ValueError:  # if they have no common root
+        return None
+    if common_root in (shulker_root, instance_root):
+        return None
+    return os.path.relpath(shulker_root, instance_root)
+
+
+def _compile_do_not_link(patterns: Sequence[str]) -> re.Pattern[str]:
+    """Combine a shulker box's do-not-link patterns into a single regex
+
+    Parameters
+    ----------
+    patterns : list-like of str
+        The glob patterns for files that should not be linked
+
+    Returns
+    -------
+    Pattern
+        A compiled regex that will match any path (relative to the shulker box
+        root) matching one of those patterns, either in full or from any of the
+        path's parent folders. The name of the group that matched will be
+        "p" followed by the index of the pattern that matched.
+    """
+    if not patterns:
+        return re.compile("(?!)")  # never matches
+    return re.compile(
+        "|".join(
+            f"(?P<p{i}>{fnmatch.translate(pattern)}"
+            f"|{fnmatch.translate(os.path.join('*', pattern))})"
+            for i, pattern in enumerate(patterns)
+        )
     )
 
 
-def _rglob(root: Path, max_depth: int) -> Iterable[Path]:
+def _list_linkable_resources(
+    shulker_box: ShulkerBox, box_root: Path, link_folder_paths: Collection[Path]
+) -> list[tuple[Path, bool]]:
+    """List the files (and folders) inside a shulker box that should be
+    linked individually
+
+    Parameters
+    ----------
+    shulker_box : ShulkerBox
+        The shulker box to scan
+    box_root : Path
+        The absolute path to the shulker box's folder
+    link_folder_paths : list-like of Paths
+        The (absolute) paths of the shulker box's link folders, which get linked
+        as a whole and so should not be scanned
+
+    Returns
+    -------
+    list of (Path, bool) tuples
+        The path (relative to the shulker box root) of every resource that
+        should be linked, excluding those that match the box's do-not-link
+        patterns, along with whether the symlink to that resource needs to
+        be created as a directory link (which only matters on Windows)
+    """
+    do_not_link = _compile_do_not_link(shulker_box.do_not_link)
+    # every resource is inside the box root, so there's no need for the full
+    # Path.relative_to machinery
+    root_length = len(os.path.join(box_root, ""))
+    linkable: list[tuple[Path, bool]] = []
+    for entry in _scan(box_root, shulker_box.max_link_depth, exclude=link_folder_paths):
+        relative_path = entry.path[root_length:]
+        resource_path = Path(relative_path)
+        if skip := do_not_link.match(relative_path):
+            PLACE_LOGGER.debug(
+                "Skipping %s (matches pattern %s)",
+                resource_path,
+                shulker_box.do_not_link[int(skip.lastgroup[1:])],  # type: ignore
+            )
+        else:
+            # the directory listing already knows what each resource is, so
+            # this saves link_resource from having to stat it
+            linkable.append((resource_path, os.name == "nt" and entry.is_dir()))
+    return linkable
+
+
+def _rglob(
+    root: Path, max_depth: int, exclude: Collection[Path] = ()
+) -> Iterable[Path]:
     """Find all files (and directories* and symlinks) in the path up to the
     specified depth
 
@@ -409,6 +616,9 @@ def _rglob(root: Path, max_depth: int) -> Iterable[Path]:
         The path to search
     max_depth : int
         The maximum number of levels to go
+    exclude : list-like of Paths, optional
+        Any paths (prefixed by `root`) that should be skipped over entirely,
+        along with all of their contents
 
     Returns
     -------
@@ -419,19 +629,58 @@ def _rglob(root: Path, max_depth: int) -> Iterable[Path]:
     -----
     - Unlike an actual rglob, this method does not return any directories that
       are not at the maximum depth
-    - Setting max_depth to 0 (or below) will return all files in the root, but
-      ***be warned*** that because this method follows symlinks, you can very
-      easily find yourself in an infinite loop
+    - Setting max_depth to 0 (or below) will return all files in the root
+    - This method follows symlinks, but it will not descend into a folder
+      that's also one of its own parents (which would otherwise loop forever).
+      Such a link is instead returned as-is, as if it were at the maximum depth.
     """
-    top_level = root.iterdir()
-    if max_depth == 1:
-        return top_level
-    return itertools.chain(
-        *(
-            _rglob(path, max_depth - 1) if path.is_dir() else (path,)
-            for path in top_level
-        )
-    )
+    return (Path(entry.path) for entry in _scan(root, max_depth, exclude))
+
+
+def _scan(
+    root: Path, max_depth: int, exclude: Collection[Path] = ()
+) -> Iterable[os.DirEntry[str]]:
+    """Same as `_rglob`, but yielding the `os.DirEntry` for each path, which
+    caches what the directory listing says about the file's type"""
+    excluded = {os.fspath(path) for path in exclude}
+    # the (device, inode) IDs of folders, looked up only when needed to check
+    # whether a linked folder is one of its own parents
+    folder_ids: dict[str, tuple[int, int]] = {}
+
+    def folder_id(path: str) -> tuple[int, int]:
+        if path not in folder_ids:
+            path_stat = os.stat(path)
+            folder_ids[path] = (path_stat.st_dev, path_stat.st_ino)
+        return folder_ids[path]
+
+    # each folder is paired with the paths of itself and all of its parents so
+    # that symlink cycles can be detected
+    folders: list[tuple[str, int, tuple[str, ...]]] = [
+        (os.fspath(root), max_depth, (os.fspath(root),))
+    ]
+    while folders:
+        folder, depth, lineage = folders.pop()
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.path in excluded:
+                    continue
+                # DirEntry caches what the directory listing said about each
+                # entry, so (outside of symlinks) this doesn't need a stat
+                if depth == 1 or not entry.is_dir():
+                    yield entry
+                    continue
+                # only a followed symlink can lead back to a parent folder
+                if entry.is_symlink() and folder_id(entry.path) in map(
+                    folder_id, lineage
+                ):
+                    PLACE_LOGGER.debug(
+                        "Not descending into %s, as it links back to one of"
+                        " its own parent folders",
+                        entry.path,
+                    )
+                    yield entry
+                else:
+                    folders.append((entry.path, depth - 1, (*lineage, entry.path)))
 
 
 def cache_placements(
@@ -448,8 +697,11 @@ def cache_placements(
         A record of placed links, as generated by `place_ender_chest`
     """
     cache_file = fs.place_cache(minecraft_root)
-    cache_file.write_text(
-        json.dumps(
+    # JSON keys have to be strings, but the lists of shulker boxes are shared
+    # rather than copied, and the file is written as it's encoded instead of
+    # building the whole document in memory first
+    with cache_file.open("w", encoding="UTF-8") as cache:
+        json.dump(
             {
                 instance_name: {
                     str(resource_path): shulker_boxes
@@ -457,10 +709,10 @@ def cache_placements(
                 }
                 for instance_name, instance_placements in placements.items()
             },
+            cache,
             indent=4,
             sort_keys=False,
         )
-    )
     PLACE_LOGGER.debug("Placement cache written to %s", cache_file)
 
 
@@ -556,23 +808,57 @@ def trace_resource(
         )
     }
     if instance_name is None:
-        return sum(
-            (
-                trace_resource(minecraft_root, pattern, placements, name)
-                for name in instances
-            ),
-            [],
+        return list(
+            itertools.chain.from_iterable(
+                _trace_resource(minecraft_root, pattern, placements, instance)
+                for instance in instances.values()
+            )
         )
-    instance_root = instances[instance_name].root
+    return _trace_resource(
+        minecraft_root, pattern, placements, instances[instance_name]
+    )
+
+
+def _trace_resource(
+    minecraft_root: Path,
+    pattern: str,
+    placements: dict[str, dict[Path, list[str]]],
+    instance: InstanceSpec,
+) -> list[tuple[Path, Path, list[str]]]:
+    """Find the placed symlinks within a single instance matching the provided
+    pattern
+
+    Parameters
+    ----------
+    minecraft_root : Path
+        The root directory that your minecraft stuff (or, at least, the one
+        that's the parent of your EnderChest folder)
+    pattern : filename, path or glob pattern
+        The resource to trace
+    placements : dict
+        A record of placed symlinks, such as the one generated by `place_ender_chest`.
+    instance : InstanceSpec
+        The instance to search
+
+    Returns
+    -------
+    list of (Path, Path, list) tuples
+        The matching resources, in the format returned by `trace_resource`
+    """
+    instance_root = instance.root
+    instance_path = os.path.abspath(minecraft_root / instance_root)
+
+    starred_pattern = fnmatch.translate(os.path.join("*", pattern))
+    matches_relative = re.compile(
+        f"{fnmatch.translate(pattern)}|{starred_pattern}"
+    ).match
+    matches_absolute = re.compile(starred_pattern).match
+
     matches: list[tuple[Path, Path, list[str]]] = []
-    for resource_path, target_boxes in placements[instance_name].items():
-        if (
-            fnmatch.fnmatchcase(str(resource_path), pattern)
-            or fnmatch.fnmatchcase(str(resource_path), os.path.join("*", pattern))
-            or fnmatch.fnmatchcase(
-                os.path.abspath(minecraft_root / instance_root / resource_path),
-                os.path.join("*", pattern),
-            )
+    for resource_path, target_boxes in placements[instance.name].items():
+        relative_path = str(resource_path)
+        if matches_relative(relative_path) or matches_absolute(
+            os.path.join(instance_path, relative_path)
         ):
             matches.append((instance_root, resource_path, target_boxes))
     return matches
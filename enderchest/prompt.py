@@ -3,10 +3,18 @@ import getpass
 
 CURSOR = "\x1b[35;1m==>\x1b[0m"
 
+_LINE_START = f"{CURSOR}\x1b[1m "
+
+_LINE_END = "\x1b[0m"
+
+_SUGGESTION_START = "\x1b[35;1m["
+
+_SUGGESTION_END = "]\x1b[0m "
+
 # https://stackoverflow.com/a/18472142
-YES = ("y", "yes", "t", "true", "on", "1")
+YES = frozenset(("y", "yes", "t", "true", "on", "1"))
 
-NO = ("n", "no", "f", "false", "off", "0")
+NO = frozenset(("n", "no", "f", "false", "off", "0"))
 
 
 def prompt(
@@ -31,19 +39,20 @@ def prompt(
 
     Notes
     -----
-    - The output will be stripped of trailing and leading whitespace, but no
-      other validation or processing will be used.
+    - The output will be stripped of trailing and leading whitespace (unless
+      this is a password prompt), but no other validation or processing will
+      be used.
     - Regardless of whether a suggestion is provided, if the user provides an
       empty input, this method will return an empty string. To reiterate: the
       suggestion *does not serve* as a default / fallback value.
     """
     lines = message.splitlines() + [""]
-    message = "\n".join(f"{CURSOR}\x1b[1m {line}\x1b[0m" for line in lines)
+    message = "\n".join([_LINE_START + line + _LINE_END for line in lines])
     if suggestion is not None:
-        message += f"\x1b[35;1m[{suggestion}]\x1b[0m "
+        message += _SUGGESTION_START + suggestion + _SUGGESTION_END
     if is_password:
         return getpass.getpass(prompt=message)
-    return input(message)
+    return input(message).strip()
 
 
 def confirm(default: bool) -> bool:
@@ -60,7 +69,7 @@ def confirm(default: bool) -> bool:
         Whether the user has opted to continue
     """
 
-    response = prompt("Do you wish to continue?", "Y/n" if default else "y/N")
+    response = prompt("Do you wish to continue?", "Y/n" if default else "y/N").lower()
 
     if response == "":
         return default
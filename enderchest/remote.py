@@ -1,17 +1,38 @@
 """Higher-level functionality around synchronizing with different EnderCherts"""
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from time import sleep
 from typing import Sequence
-from urllib.parse import ParseResult, urlparse
+from urllib.parse import ParseResult, quote, urlparse
 
 from . import filesystem as fs
 from . import inventory, place
 from .enderchest import EnderChest
 from .loggers import IMPORTANT, SYNC_LOGGER
 from .prompt import confirm
-from .sync import abspath_from_uri, pull, push, remote_file, render_remote
+from .sync import (
+    abspath_from_uri,
+    get_default_netloc,
+    pull,
+    push,
+    remote_file,
+    render_remote,
+)
+
+# the ways a single sync can fail without taking down the syncs with other remotes
+_SYNC_FAILURES = (
+    FileNotFoundError,
+    ValueError,
+    NotImplementedError,
+    TimeoutError,
+    RuntimeError,
+)
+
+# cap on the number of remotes that will be pushed to at the same time
+_MAX_CONCURRENT_PUSHES = 8
 
 
 def load_remote_ender_chest(uri: str | ParseResult) -> EnderChest:
@@ -77,20 +98,143 @@ def fetch_remotes_from_a_remote_ender_chest(
     remotes: list[tuple[ParseResult, str]] = [
         (urlparse(uri) if isinstance(uri, str) else uri, remote_chest.name)
     ]
+    aliases: set[str] = {remote_chest.name}
+    for remote, alias in remote_chest.remotes:
+        if alias in aliases:
+            raise RuntimeError(
+                f"The alias {alias!r} appears more than once"
+                f" in the list of remotes pulled from {uri}"
+            )
+        aliases.add(alias)
+        remotes.append((remote, alias))
 
-    remotes.extend(remote_chest.remotes)
-    SYNC_LOGGER.info(
-        "Loaded the following remotes:\n %s",
-        "\n".join(f"  - {render_remote(alias, uri)}" for uri, alias in remotes),
-    )
-
-    if len(set(alias for _, alias in remotes)) != len(remotes):
-        raise RuntimeError(
-            f"There are duplicates aliases in the list of remotes pulled from {uri}"
+    if SYNC_LOGGER.isEnabledFor(logging.INFO):
+        SYNC_LOGGER.info(
+            "Loaded the following remotes:\n %s",
+            "\n".join([f"  - {render_remote(alias, uri)}" for uri, alias in remotes]),
         )
     return remotes
 
 
+def _uri_path(path: Path) -> str:
+    """Render a local path as the (percent-encoded) path component of a URI
+
+    This is what `urlparse(path.as_uri()).path` would give you (modulo which
+    characters get escaped, which doesn't matter since the sync backends all
+    unquote the path), just without building and then re-parsing the full URI.
+
+    Parameters
+    ----------
+    path : Path
+        The (absolute) path to render
+
+    Returns
+    -------
+    str
+        The URI path
+    """
+    posix_path = path.as_posix()
+    if path.drive.endswith(":"):  # Windows drive letters need a leading slash
+        posix_path = "/" + posix_path
+    return quote(os.fsencode(posix_path), safe="/:")
+
+
+def _sync_with_remote(
+    pull_or_push: str,
+    local_chest: Path,
+    remote_uri: ParseResult,
+    rendered: str,
+    exclude: set[str],
+    dry_run: bool,
+    prefix: str,
+    remote_chest: EnderChest | None = None,
+    **sync_kwargs,
+) -> EnderChest | None:
+    """Perform a single pull from or push to a remote EnderChest
+
+    Parameters
+    ----------
+    pull_or_push : str
+        "pull" or "push"
+    local_chest : Path
+        The local EnderChest folder (pulls go into its parent, the Minecraft root)
+    remote_uri : ParseResult
+        The URI of the remote's Minecraft root
+    rendered : str
+        The remote, rendered for logging
+    exclude : set of str
+        The local exclusions (the remote's own exclusions will be added to these)
+    dry_run : bool
+        Whether to only simulate this sync
+    prefix : str
+        How to start the log message announcing the sync
+    remote_chest : EnderChest, optional
+        The remote's EnderChest config, if it's already been fetched
+    sync_kwargs
+        Any additional arguments that should be passed into the syncing
+        operation
+
+    Returns
+    -------
+    EnderChest or None
+        The remote's EnderChest config (so that it can be reused for any
+        follow-up syncs) if the sync was successful, None otherwise
+    """
+    try:
+        if remote_chest is None:
+            remote_chest = load_remote_ender_chest(remote_uri)
+        exclude = exclude.union(remote_chest.do_not_sync)
+        if pull_or_push == "pull":
+            SYNC_LOGGER.log(IMPORTANT, "%s to pull changes from %s", prefix, rendered)
+            remote_chest_folder = remote_uri._replace(
+                path=_uri_path(
+                    fs.ender_chest_folder(
+                        abspath_from_uri(remote_uri), check_exists=False
+                    )
+                )
+            )
+            pull(
+                remote_chest_folder,
+                local_chest.parent,
+                exclude=exclude,
+                dry_run=dry_run,
+                **sync_kwargs,
+            )
+        else:
+            SYNC_LOGGER.log(IMPORTANT, "%s to push changes to %s", prefix, rendered)
+            push(
+                local_chest,
+                remote_uri,
+                exclude=exclude,
+                dry_run=dry_run,
+                **sync_kwargs,
+            )
+    except _SYNC_FAILURES as sync_fail:
+        SYNC_LOGGER.warning(f"Could not sync changes with {rendered}:\n  {sync_fail}")
+        return None
+    return remote_chest
+
+
+def _is_unattended(remote_uri: ParseResult) -> bool:
+    """Determine whether syncing with a remote is guaranteed not to prompt for
+    anything, because the sync never leaves this machine
+
+    Parameters
+    ----------
+    remote_uri : ParseResult
+        The URI of the remote
+
+    Returns
+    -------
+    bool
+        True if the sync can't ask for credentials, False if it might
+    """
+    if remote_uri.scheme == "file":
+        return True
+    # rsync performs these as local transfers
+    return remote_uri.scheme == "rsync" and remote_uri.netloc == get_default_netloc()
+
+
 def sync_with_remotes(
     minecraft_root: Path,
     pull_or_push: str,
@@ -130,18 +274,19 @@ def sync_with_remotes(
     - When pulling changes, this method will try each remote in the order they
       are configured and stop once it has successfully pulled from a remote.
 
-    This method will attempt to push local changes to *every* remote
+    This method will attempt to push local changes to *every* remote. When
+    there's no dry run or confirmation to wait on, pushes to remotes on this
+    same machine (which can't prompt for credentials) will run concurrently.
     """
     if pull_or_push not in ("pull", "push"):
         raise ValueError(
             'Invalid choice for sync operation. Choices are "pull" and "push"'
         )
     try:
-        if sync_confirm_wait is None:
-            sync_confirm_wait = inventory.load_ender_chest(
-                minecraft_root
-            ).sync_confirm_wait
         this_chest = inventory.load_ender_chest(minecraft_root)
+        if sync_confirm_wait is None:
+            sync_confirm_wait = this_chest.sync_confirm_wait
+        local_chest = fs.ender_chest_folder(minecraft_root)
 
         # I know this is redundant, but we want those logs
         remotes = inventory.load_ender_chest_remotes(
@@ -158,85 +303,69 @@ def sync_with_remotes(
 
     synced_somewhere = False
     exclusions: Sequence[str] = sync_kwargs.pop("exclude", None) or ()
-    for remote_uri, alias in remotes:
-        if dry_run:
-            runs: tuple[bool, ...] = (True,)
-        elif sync_confirm_wait is False or sync_confirm_wait <= 0:
-            runs = (False,)
-        else:
-            runs = (True, False)
-        for do_dry_run in runs:
-            if dry_run:
-                prefix = "Simulating an attempt"
-            else:
-                prefix = "Attempting"
-            try:
-                remote_chest = load_remote_ender_chest(remote_uri)
-                if pull_or_push == "pull":
-                    SYNC_LOGGER.log(
-                        IMPORTANT,
-                        f"{prefix} to pull changes from %s",
-                        render_remote(alias, remote_uri),
-                    )
-                    remote_chest_folder = remote_uri._replace(
-                        path=urlparse(
-                            (
-                                fs.ender_chest_folder(
-                                    abspath_from_uri(remote_uri),
-                                    check_exists=False,
-                                )
-                            ).as_uri()
-                        ).path
-                    )
-                    pull(
-                        remote_chest_folder,
-                        minecraft_root,
-                        exclude={
-                            *this_chest.do_not_sync,
-                            *remote_chest.do_not_sync,
-                            *exclusions,
-                        },
-                        dry_run=do_dry_run,
-                        **sync_kwargs,
-                    )
-                else:
-                    SYNC_LOGGER.log(
-                        IMPORTANT,
-                        f"{prefix} to push changes"
-                        f" to {render_remote(alias, remote_uri)}",
-                    )
-                    local_chest = fs.ender_chest_folder(minecraft_root)
-                    push(
+    # the parts of the sync that don't depend on the remote
+    local_exclusions = {*this_chest.do_not_sync, *exclusions}
+    if dry_run:
+        runs: tuple[bool, ...] = (True,)
+        prefix = "Simulating an attempt"
+    elif sync_confirm_wait is False or sync_confirm_wait <= 0:
+        runs = (False,)
+        prefix = "Attempting"
+    else:
+        runs = (True, False)
+        prefix = "Attempting"
+    if pull_or_push == "push" and runs == (False,):
+        # with nothing to sequence between them, each push is independent, but
+        # only pushes that can't ask for credentials can safely share the terminal
+        unattended = [remote for remote in remotes if _is_unattended(remote[0])]
+        if len(unattended) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(len(unattended), _MAX_CONCURRENT_PUSHES)
+            ) as executor:
+                pushes = [
+                    executor.submit(
+                        _sync_with_remote,
+                        "push",
                         local_chest,
                         remote_uri,
-                        exclude={
-                            *this_chest.do_not_sync,
-                            *remote_chest.do_not_sync,
-                            *exclusions,
-                        },
-                        dry_run=do_dry_run,
+                        render_remote(alias, remote_uri),
+                        local_exclusions,
+                        False,
+                        prefix,
                         **sync_kwargs,
                     )
-            except (
-                FileNotFoundError,
-                ValueError,
-                NotImplementedError,
-                TimeoutError,
-                RuntimeError,
-            ) as sync_fail:
-                SYNC_LOGGER.warning(
-                    f"Could not sync changes with {render_remote(alias, remote_uri)}:"
-                    f"\n  {sync_fail}"
+                    for remote_uri, alias in unattended
+                ]
+                synced_somewhere = any(
+                    [pushed.result() is not None for pushed in pushes]
                 )
+            remotes = [remote for remote in remotes if remote not in unattended]
+    for remote_uri, alias in remotes:
+        # fetched once and then reused for both the dry run and the real one
+        remote_chest: EnderChest | None = None
+        rendered = render_remote(alias, remote_uri)
+        for do_dry_run in runs:
+            remote_chest = _sync_with_remote(
+                pull_or_push,
+                local_chest,
+                remote_uri,
+                rendered,
+                local_exclusions,
+                do_dry_run,
+                prefix,
+                remote_chest,
+                **sync_kwargs,
+            )
+            if remote_chest is None:
                 break
-            if do_dry_run == runs[-1]:
+            if dry_run or not do_dry_run:  # nothing left to confirm
                 continue
             if sync_confirm_wait is True:
                 if not confirm(default=True):
                     SYNC_LOGGER.error("Aborting")
                     return
             else:
-                SYNC_LOGGER.debug(f"Waiting for {sync_confirm_wait} seconds")
+                SYNC_LOGGER.debug("Waiting for %s seconds", sync_confirm_wait)
                 sleep(sync_confirm_wait)
         else:
             synced_somewhere = True
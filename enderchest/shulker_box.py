@@ -1,6 +1,7 @@
 """Specification and configuration of a shulker box"""
 
 import fnmatch
+import functools
 import os
 import re
 from pathlib import Path
@@ -17,6 +18,10 @@ _DEFAULT_PRIORITY = 0
 _DEFAULT_LINK_DEPTH = 2
 _DEFAULT_DO_NOT_LINK = ("shulkerbox.cfg", ".DS_Store")
 
+# the order in which to check match conditions, cheapest first, so that an
+# instance that doesn't match fails out before any version parsing happens
+_MATCH_COST = {"hosts": 0, "instances": 1, "tags": 2, "modloader": 3, "minecraft": 4}
+
 
 class ShulkerBox(NamedTuple):
     """Specification of a shulker box
@@ -206,7 +211,7 @@ class ShulkerBox(NamedTuple):
             True if the instance matches the shulker box's conditions, False
             otherwise.
         """
-        for condition, values in self.match_criteria:
+        for condition, values in _by_match_cost(self.match_criteria):
             match condition:  # these should have been normalized on read-in
                 case "instances":
                     matchers = []
@@ -306,6 +311,39 @@ class ShulkerBox(NamedTuple):
         return True
 
 
+@functools.cache
+def _by_match_cost(
+    match_criteria: tuple[tuple[str, tuple[str, ...]], ...],
+) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Order a shulker box's match criteria from cheapest to most expensive to
+    check, leaving the box's own (user-specified) order untouched
+
+    Parameters
+    ----------
+    match_criteria : tuple of (str, tuple) tuples
+        The shulker box's match criteria
+
+    Returns
+    -------
+    tuple of (str, tuple) tuples
+        The same criteria, sorted by cost
+
+    Raises
+    ------
+    NotImplementedError
+        If any of the conditions isn't one that can be applied (so that an
+        invalid config always fails, even if a cheaper check would fail first)
+    """
+    for condition, _ in match_criteria:
+        if condition not in _MATCH_COST:
+            raise NotImplementedError(
+                f"Don't know how to apply match condition {condition}."
+            )
+    return tuple(
+        sorted(match_criteria, key=lambda criterion: _MATCH_COST[criterion[0]])
+    )
+
+
 def _matches_version(version_spec: str, version_string: str) -> bool:
     """Determine whether a version spec matches a version string, taking into
     account that neither users nor Mojang rigidly follow semver (or at least
@@ -328,11 +366,57 @@ def _matches_version(version_spec: str, version_string: str) -> bool:
     This method *does not* match snapshots to their corresponding version
     range--for that you're just going to have to be explicit.
     """
+    spec = _parse_version_spec(version_spec)
+    if spec is not None and (version := _parse_version(version_string)) is not None:
+        return spec.match(version)
+    # fall back to simple fnmatching
+    return fnmatch.fnmatchcase(version_string.lower(), version_spec.lower())
+
+
+@functools.cache
+def _parse_version_spec(version_spec: str) -> semver.SimpleSpec | None:
+    """Parse a version spec, caching the result (since the same spec gets
+    checked against every instance)
+
+    Parameters
+    ----------
+    version_spec : str
+        A version specification provided by a user
+
+    Returns
+    -------
+    SimpleSpec or None
+        The parsed spec, or None if it isn't valid semver
+    """
     try:
-        return semver.SimpleSpec(version_spec).match(semver.Version(version_string))
+        return semver.SimpleSpec(version_spec)
     except ValueError:
-        # fall back to simple fnmatching
-        return fnmatch.fnmatchcase(version_string.lower(), version_spec.lower())
+        return None
+
+
+@functools.cache
+def _parse_version(version_string: str) -> semver.Version | None:
+    """Parse a version string, caching the result (since the same versions
+    get checked against every shulker box)
+
+    Parameters
+    ----------
+    version_string : str
+        A version string, likely parsed from an instance's configuration
+
+    Returns
+    -------
+    Version or None
+        The parsed version, or None if it isn't valid semver
+    """
+    try:
+        return semver.Version(version_string)
+    except ValueError:
+        return None
+
+
+_REGEX_PATTERN = re.compile(r"^r('|\").*\1$")
+_QUOTED_PATTERN = re.compile(r"^('|\").*\1$")
 
 
 def _matches_string(pattern: str, value: str, case_sensitive: bool = False) -> bool:
@@ -354,16 +438,43 @@ def _matches_string(pattern: str, value: str, case_sensitive: bool = False) -> b
     bool
         True if the pattern matches the value, False otherwise
     """
-    pattern = pattern.strip()
+    matcher, fold_case = _compile_string_pattern(pattern, case_sensitive)
     value = value.strip()
-    if re.match(r"^r('|\").*\1$", pattern):
-        return re.match(pattern[2:-1], value) is not None
-    if re.match(r"^('|\").*\1$", pattern):
+    if fold_case:
+        value = value.lower()
+    return matcher.match(value) is not None
+
+
+@functools.cache
+def _compile_string_pattern(
+    pattern: str, case_sensitive: bool
+) -> tuple[re.Pattern, bool]:
+    """Compile a pattern used by `_matches_string` into a regex, so that the
+    same box criteria aren't re-parsed for every instance they're checked
+    against
+
+    Parameters
+    ----------
+    pattern : str
+        The pattern to compile
+    case_sensitive : bool
+        Whether the matching is case-sensitive
+
+    Returns
+    -------
+    re.Pattern
+        The compiled pattern
+    bool
+        Whether the value being matched needs to be lowercased first
+    """
+    pattern = pattern.strip()
+    if _REGEX_PATTERN.match(pattern):
+        return re.compile(pattern[2:-1]), False
+    if _QUOTED_PATTERN.match(pattern):
         pattern = pattern[1:-1]
     if not case_sensitive:
         pattern = pattern.lower()
-        value = value.lower()
-    return fnmatch.fnmatchcase(value, pattern)
+    return re.compile(fnmatch.translate(pattern)), not case_sensitive
 
 
 def create_shulker_box(
@@ -16,6 +16,11 @@ if RSYNC is None:  # pragma: no cover
         "No rsync executable found on your system. Cannot sync using this protocol."
     )
 
+# For transfers where both ends are on this machine there's no network to save
+# bandwidth on, so skip the compression (the "z" in the default "shaz") and
+# copy whole files rather than running the delta-transfer algorithm
+_LOCAL_RSYNC_FLAGS = "shaW"
+
 
 def _get_rsync_version() -> tuple[int, int]:
     """Determine the installed version of Rsync
@@ -310,10 +315,11 @@ def summarize_rsync_report(raw_output: str, depth: int = 2) -> list[str]:
     for path_key, report in sorted(summary.items()):
         if isinstance(report, str):
             # nice that these verbs follow the same pattern
-            SYNC_LOGGER.info(f"{report[:-1].title()}ing {path_key}")
+            SYNC_LOGGER.info("%sing %s", report[:-1].title(), path_key)
         else:
             SYNC_LOGGER.info(
-                f"Within {path_key}...\n%s",
+                "Within %s...\n%s",
+                path_key,
                 "\n".join(
                     f"  - {op[:-1].title()}ing {count} file{'' if count == 1 else 's'}"
                     for op, count in report.items()
@@ -386,7 +392,7 @@ def pull(
         logs. Defaults to 0.
     rsync_args: list of str, optional
         Any additional arguments to pass into rsync. Note that rsync is run by
-        default with the flags: `-shaz`
+        default with the flags: `-shaz` (or `-shaW` for local transfers)
 
     Raises
     ------
@@ -404,9 +410,11 @@ def pull(
     if not local_path.exists():
         raise FileNotFoundError(f"{local_path} does not exist")
 
+    rsync_flags: str | None = None
     if remote_uri.netloc == get_default_netloc():
         SYNC_LOGGER.debug("Performing sync as a local transfer")
         remote_path: str = unquote(remote_uri.path)
+        rsync_flags = _LOCAL_RSYNC_FLAGS
     elif use_daemon:
         remote_path = remote_uri.geturl()
     else:
@@ -425,6 +433,7 @@ def pull(
         *(rsync_args or ()),
         timeout=timeout,
         verbosity=verbosity,
+        rsync_flags=rsync_flags,
     )
 
 
@@ -468,7 +477,7 @@ def push(
         logs. Defaults to 0.
     rsync_args: list of str, optional
         Any additional arguments to pass into rsync. Note that rsync is run by
-        default with the flags: `-shaz`
+        default with the flags: `-shaz` (or `-shaW` for local transfers)
 
     Notes
     -----
@@ -478,9 +487,11 @@ def push(
     - If the destination folder does not already exist, this method will very
       likely fail.
     """
+    rsync_flags: str | None = None
     if remote_uri.netloc == get_default_netloc():
         SYNC_LOGGER.debug("Performing sync as a local transfer")
         remote_path: str = unquote(remote_uri.path)
+        rsync_flags = _LOCAL_RSYNC_FLAGS
     elif use_daemon:
         remote_path = remote_uri.geturl()
     else:
@@ -499,4 +510,5 @@ def push(
         *(rsync_args or ()),
         timeout=timeout,
         verbosity=verbosity,
+        rsync_flags=rsync_flags,
     )
@@ -190,7 +190,7 @@ def rglob(
     - The paths returned are *absolute*
     - The search is performed depth-first
     """
-    SYNC_LOGGER.debug(f"ls {path}")
+    SYNC_LOGGER.debug("ls %s", path)
     top_level = client.listdir_attr(path)
     contents: list[tuple[Path, paramiko.sftp_attr.SFTPAttributes]] = []
     for remote_object in top_level:
@@ -2,6 +2,7 @@
 
 import fnmatch
 import getpass
+import logging
 import os
 import socket
 import stat
@@ -268,6 +269,8 @@ def generate_sync_report(
     -------
     None
     """
+    if not SYNC_LOGGER.isEnabledFor(logging.INFO):
+        return
     summary: dict[Path, dict[Operation, int] | Operation] = defaultdict(
         lambda: {Operation.CREATE: 0, Operation.REPLACE: 0, Operation.DELETE: 0}
     )
@@ -292,10 +295,11 @@ def generate_sync_report(
     for path_key, report in sorted(summary.items()):
         if isinstance(report, Operation):
             # nice that these verbs follow the same pattern
-            SYNC_LOGGER.info(f"{report.name[:-1].title()}ing {path_key}")
+            SYNC_LOGGER.info("%sing %s", report.name[:-1].title(), path_key)
         else:
             SYNC_LOGGER.info(
-                f"Within {path_key}...\n%s",
+                "Within %s...\n%s",
+                path_key,
                 "\n".join(
                     f"  - {op.name[:-1].title()}ing {count} file{'' if count == 1 else 's'}"
                     for op, count in report.items()
@@ -17,6 +17,54 @@ class TestLoadEnderChestInstances:
         assert inventory.load_ender_chest_instances(tmp_path) == []
 
 
+class TestConfigCaching:
+    @pytest.fixture(autouse=True)
+    def populate_shulker_boxes(self, minecraft_root):
+        utils.pre_populate_enderchest(
+            minecraft_root / "EnderChest", *utils.TESTING_SHULKER_CONFIGS
+        )
+
+    def test_repeated_loads_dont_reparse_the_chest(self, minecraft_root, monkeypatch):
+        _ = inventory.load_ender_chest(minecraft_root)
+
+        def refuse_to_parse(*args, **kwargs):
+            raise AssertionError("Config was re-parsed")
+
+        monkeypatch.setattr(inventory.EnderChest, "from_cfg", refuse_to_parse)
+        monkeypatch.setattr(inventory.ShulkerBox, "from_cfg", refuse_to_parse)
+
+        _ = inventory.load_ender_chest(minecraft_root)
+
+    def test_mutating_a_loaded_chest_doesnt_affect_the_cache(self, minecraft_root):
+        chest = inventory.load_ender_chest(minecraft_root)
+        chest.name = "mutated"
+        chest._instances.clear()
+
+        reloaded = inventory.load_ender_chest(minecraft_root)
+        assert (reloaded.name, len(reloaded.instances)) != ("mutated", 0)
+
+    def test_modified_shulker_config_gets_reparsed(self, minecraft_root):
+        original = {
+            box.name: box
+            for box in inventory.load_shulker_boxes(
+                minecraft_root, log_level=logging.DEBUG
+            )
+        }["global"]
+
+        original._replace(priority=original.priority + 100).write_to_cfg(
+            fs.shulker_box_config(minecraft_root, "global")
+        )
+
+        reloaded = {
+            box.name: box
+            for box in inventory.load_shulker_boxes(
+                minecraft_root, log_level=logging.DEBUG
+            )
+        }["global"]
+
+        assert reloaded.priority == original.priority + 100
+
+
 class TestListShulkerBoxes:
     @pytest.fixture(autouse=True)
     def populate_shulker_boxes(self, minecraft_root):
@@ -47,6 +47,139 @@ class TestRglob:
 
         assert expected == sorted(place._rglob(instances_folder, 2))
 
+    def test_excluded_paths_are_pruned(self, minecraft_root) -> None:
+        instances_folder = minecraft_root / "instances"
+        excluded = instances_folder / utils.TESTING_INSTANCES[1].root.parent.name
+
+        rglob = list(place._rglob(instances_folder, 0, exclude={excluded}))
+        assert len(rglob) > 0  # meta-test
+
+        assert not any(path.is_relative_to(excluded) for path in rglob)
+
+    def test_symlink_cycles_are_not_followed(self, tmp_path) -> None:
+        (tmp_path / "folder" / "subfolder").mkdir(parents=True)
+        (tmp_path / "folder" / "subfolder" / "file.txt").write_text("hello\n")
+        (tmp_path / "folder" / "subfolder" / "loop").symlink_to(
+            tmp_path / "folder", target_is_directory=True
+        )
+
+        assert sorted(place._rglob(tmp_path, 0)) == [
+            tmp_path / "folder" / "subfolder" / "file.txt",
+            tmp_path / "folder" / "subfolder" / "loop",
+        ]
+
+    def test_real_folders_are_not_stat_ed(self, tmp_path, monkeypatch) -> None:
+        (tmp_path / "folder" / "subfolder").mkdir(parents=True)
+        (tmp_path / "folder" / "subfolder" / "file.txt").write_text("hello\n")
+
+        stat_calls: list[str] = []
+        real_stat = os.stat
+
+        def spy_stat(path, *args, **kwargs):
+            stat_calls.append(path)
+            return real_stat(path, *args, **kwargs)
+
+        monkeypatch.setattr(os, "stat", spy_stat)
+
+        assert list(place._rglob(tmp_path, 0)) == [
+            tmp_path / "folder" / "subfolder" / "file.txt"
+        ]
+        assert stat_calls == []
+
+    def test_separate_links_to_the_same_folder_are_both_followed(
+        self, tmp_path
+    ) -> None:
+        (tmp_path / "shared").mkdir()
+        (tmp_path / "shared" / "file.txt").write_text("hello\n")
+        for name in ("one", "two"):
+            (tmp_path / name).symlink_to(tmp_path / "shared", target_is_directory=True)
+
+        assert sorted(place._rglob(tmp_path, 0)) == [
+            tmp_path / name / "file.txt" for name in ("one", "shared", "two")
+        ]
+
+
+class TestCompileDoNotLink:
+    @pytest.mark.parametrize(
+        "path, expected",
+        (
+            ("saves", "p0"),
+            ("backups/saves", "p0"),
+            ("logs/latest.log", "p1"),
+            ("screenshots/Screenshot.png", None),
+            ("not_saves", None),
+        ),
+    )
+    def test_matches_like_fnmatch(self, path, expected):
+        pattern = place._compile_do_not_link(("saves", "*.log"))
+        match = pattern.match(os.path.normpath(path))
+        assert (match.lastgroup if match else None) == expected
+
+    def test_no_patterns_matches_nothing(self):
+        assert place._compile_do_not_link(()).match("anything") is None
+
+
+class TestSymlinksWithin:
+    def test_finds_the_same_links_as_rglob(self, minecraft_root):
+        rglob = sorted(path for path in minecraft_root.rglob("*") if path.is_symlink())
+        assert len(rglob) > 0  # meta-test
+
+        assert rglob == sorted(path for path, _ in fs.symlinks_within(minecraft_root))
+
+    def test_reports_unresolved_targets(self, minecraft_root):
+        for path, target in fs.symlinks_within(minecraft_root):
+            assert target == os.readlink(path)
+
+
+class TestLinkResource:
+    def test_replacing_a_link_leaves_nothing_else_behind(self, tmp_path):
+        for box in ("box1", "box2"):
+            (tmp_path / box).mkdir()
+            (tmp_path / box / "options.txt").write_text(f"{box}\n")
+        instance = tmp_path / "instance"
+
+        place.link_resource("options.txt", tmp_path / "box1", instance, True)
+        place.link_resource("options.txt", tmp_path / "box2", instance, True)
+
+        assert list(instance.iterdir()) == [instance / "options.txt"]
+        assert (instance / "options.txt").read_text() == "box2\n"
+
+    @pytest.mark.parametrize(
+        "shulker_root, instance_root",
+        (
+            ("EnderChest/box", "instances/inst/.minecraft"),
+            ("box", "box/instance"),
+            ("instance/box", "instance"),
+        ),
+        ids=("siblings", "instance_inside_box", "box_inside_instance"),
+    )
+    def test_relative_links_match_relpath(self, tmp_path, shulker_root, instance_root):
+        shulker_root, instance_root = tmp_path / shulker_root, tmp_path / instance_root
+        resource_path = Path("config") / "mod" / "settings.json"
+        (shulker_root / resource_path).parent.mkdir(parents=True)
+        (shulker_root / resource_path).write_text("{}\n")
+
+        place.link_resource(resource_path, shulker_root, instance_root, True)
+
+        link = instance_root / resource_path
+        assert os.readlink(link) == os.path.relpath(
+            shulker_root / resource_path, link.parent
+        )
+        assert link.read_text() == "{}\n"
+
+    def test_will_not_replace_an_actual_file(self, tmp_path):
+        (tmp_path / "box").mkdir()
+        (tmp_path / "box" / "options.txt").write_text("box\n")
+        (tmp_path / "instance").mkdir()
+        (tmp_path / "instance" / "options.txt").write_text("instance\n")
+
+        with pytest.raises(FileExistsError):
+            place.link_resource(
+                "options.txt", tmp_path / "box", tmp_path / "instance", True
+            )
+
+        assert (tmp_path / "instance" / "options.txt").read_text() == "instance\n"
+
 
 class TestSingleShulkerPlace:
     """Test the simplest case of linking--where the files in the shulker should
@@ -110,6 +243,20 @@ class TestSingleShulkerPlace:
         assert errors[0].msg.startswith("No minecraft instance exists at")
         assert placements.get("axolotl", {}) == {}
 
+    def test_each_shulker_box_is_only_scanned_once(self, minecraft_root, monkeypatch):
+        scanned: list[Path] = []
+        scan = place._scan
+
+        def spy_scan(root, *args, **kwargs):
+            scanned.append(root)
+            return scan(root, *args, **kwargs)
+
+        monkeypatch.setattr(place, "_scan", spy_scan)
+        placements = place.place_ender_chest(minecraft_root)
+
+        assert len(placements) > 1  # meta-test
+        assert len(scanned) == len(set(scanned)) == 1
+
     @pytest.mark.parametrize("relative", (True, False), ids=("relative", "absolute"))
     @utils.parametrize_over_instances("official", "axolotl")
     def test_respects_the_relative_parameter(self, minecraft_root, instance, relative):
@@ -474,6 +621,60 @@ class TestSingleShulkerPlace:
         assert existing_file.resolve() == existing_file
         assert existing_file.read_text() == "isaacs\n"
 
+    def test_missing_link_folder_does_not_block_a_later_box(self, minecraft_root):
+        chest_folder = minecraft_root / "EnderChest"
+        utils.pre_populate_enderchest(
+            chest_folder,
+            ("empty", "[properties]\npriority = 1\n\n[link-folders]\nwands\n"),
+            ("stocked", "[properties]\npriority = 2\n"),
+        )
+        # the link folder is declared, but the box doesn't actually have it
+        (chest_folder / "empty" / "wands").rmdir()
+        (chest_folder / "stocked" / "wands").mkdir()
+        (chest_folder / "stocked" / "wands" / "x.jar").write_text("zap\n")
+
+        placements = place.place_ender_chest(minecraft_root)
+
+        for instance in inventory.load_ender_chest_instances(minecraft_root):
+            instance_folder = utils.resolve(instance.root, minecraft_root)
+            assert placements[instance.name][Path("wands")] == ["empty"]
+            assert placements[instance.name][Path("wands") / "x.jar"] == ["stocked"]
+            assert not (instance_folder / "wands").is_symlink()
+            assert (instance_folder / "wands" / "x.jar").read_text() == "zap\n"
+
+    @pytest.mark.parametrize(
+        "error_handling", ("abort", "skip", "skip-instance", "skip-shulker-box")
+    )
+    def test_placements_match_what_was_linked_after_a_failure(
+        self, minecraft_root, error_handling
+    ):
+        crowded = minecraft_root / "EnderChest" / "global" / "crowded"
+        crowded.mkdir()
+        for i in range(10):
+            (crowded / f"file{i}.txt").write_text(f"{i}\n")
+
+        instance_roots = {
+            instance.name: utils.resolve(instance.root, minecraft_root)
+            for instance in inventory.load_ender_chest_instances(minecraft_root)
+        }
+        for instance_root in instance_roots.values():
+            (instance_root / "crowded").mkdir()
+            (instance_root / "crowded" / "file5.txt").write_text("in the way\n")
+
+        placements = place.place_ender_chest(
+            minecraft_root, error_handling=error_handling
+        )
+
+        for name, instance_root in instance_roots.items():
+            on_disk = {
+                file.relative_to(instance_root)
+                for file, _ in fs.symlinks_within(instance_root)
+                if fs.links_into_enderchest(minecraft_root, file)
+            }
+            assert on_disk == set(placements.get(name, {}))
+            # nothing past the conflict should have been linked
+            assert len(list((instance_root / "crowded").iterdir())) < 10
+
     @utils.parametrize_over_instances("official", "axolotl")
     def test_place_will_overwrite_an_existing_symlink(self, minecraft_root, instance):
         # this also tests that place will place files inside of a symlinked folder
@@ -527,6 +728,27 @@ class TestMatchesVersion:
         assert sb._matches_version("1.20*", version)
 
 
+class TestMatchesString:
+    @pytest.mark.parametrize(
+        "pattern, value, case_sensitive, expected",
+        (
+            ("Vanilla*", "vanilla plus", False, True),
+            ("Vanilla*", "vanilla plus", True, False),
+            ("  'Ender [Cc]hest'  ", " Ender chest ", True, True),
+            ("r'^\\d+$'", "1234", False, True),
+            ("r'^\\d+$'", "12a4", False, False),
+        ),
+    )
+    def test_compiled_patterns_match_the_same_as_before(
+        self, pattern, value, case_sensitive, expected
+    ):
+        for _ in range(2):  # the second pass hits the compiled-pattern cache
+            assert (
+                sb._matches_string(pattern, value, case_sensitive=case_sensitive)
+                is expected
+            )
+
+
 class TestShulkerInstanceMatching:
     @staticmethod
     def matchall(shulker: ShulkerBox) -> list[str]:
@@ -583,6 +805,27 @@ class TestShulkerInstanceMatching:
 
         assert self.matchall(name_matching_shulker) == ["axolotl", "Chest Boat"]
 
+    def test_cheap_criteria_are_checked_before_versions(self, monkeypatch):
+        def no_version_checks(*args, **kwargs):
+            raise AssertionError("Versions should not have been checked")
+
+        monkeypatch.setattr(sb, "_matches_version", no_version_checks)
+
+        shulker = ShulkerBox(
+            0,
+            "name_matching",
+            Path("ignoreme"),
+            (("minecraft", ("1.19",)), ("instances", ("does not exist",))),
+            (),
+        )
+
+        assert self.matchall(shulker) == []
+        # the box's own criteria (and thus its config) keep their order
+        assert [condition for condition, _ in shulker.match_criteria] == [
+            "minecraft",
+            "instances",
+        ]
+
     def test_instance_name_matching_is_exact(self):
         name_matching_shulker = ShulkerBox(
             0,
@@ -903,6 +1146,23 @@ class TestShulkerInstanceMatching:
         ):
             self.matchall(whats_this_shulker)
 
+    def test_unknown_condition_raises_error_even_if_a_cheaper_check_fails(self):
+        whats_this_shulker = ShulkerBox(
+            0,
+            "out-of-left-field",
+            Path("ignoreme"),
+            (
+                ("quizzibuck", ("duketastrophe",)),
+                ("instances", ("nobody-is-named-this",)),
+            ),
+            (),
+        )
+        with pytest.raises(
+            NotImplementedError,
+            match="Don't know how to apply match condition quizzibuck",
+        ):
+            self.matchall(whats_this_shulker)
+
 
 @pytest.mark.usefixtures("multi_box_setup_teardown")
 class TestMultiShulkerPlacing:
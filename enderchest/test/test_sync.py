@@ -20,6 +20,7 @@ from enderchest import filesystem as fs
 from enderchest import gather, inventory, place
 from enderchest import remote as r
 from enderchest import sync
+from enderchest.enderchest import EnderChest
 from enderchest.sync import utils as sync_utils
 
 from . import mock_paramiko, utils
@@ -430,6 +431,20 @@ class TestFileSync:
             / "diamond.png"
         ).read_text() == "sparkle"
 
+    def test_close_pushes_to_every_remote(self, minecraft_root, remote, tmp_path):
+        another_root = tmp_path / "even less remote"
+        shutil.copytree(sync.abspath_from_uri(remote), another_root, symlinks=True)
+        another_remote = remote._replace(path=urlparse(another_root.as_uri()).path)
+
+        gather.update_ender_chest(
+            minecraft_root, remotes=((remote, "one"), (another_remote, "two"))
+        )
+        r.sync_with_remotes(minecraft_root, "push", verbosity=-1)
+        for root in (sync.abspath_from_uri(remote), another_root):
+            assert (
+                fs.shulker_box_root(root, "vanilla") / "conflict" / "diamond.png"
+            ).read_text() == "sparkle"
+
     @pytest.mark.parametrize("operation", ("pull", "push"))
     def test_objects_are_identical_after_sync(
         self, minecraft_root, remote, caplog, operation
@@ -761,6 +776,28 @@ class TestFileSyncOnly:
             sync.push(minecraft_root / "EnderChest", remote)
 
 
+class TestUriPath:
+    @pytest.mark.parametrize(
+        "folder", ("EnderChest", "with spaces", "50% off", "what?#", "üñíçødé")
+    )
+    def test_round_trips_like_as_uri(self, tmp_path, folder):
+        path = tmp_path / folder
+        assert sync_utils.abspath_from_uri(
+            urlparse(path.as_uri())._replace(path=r._uri_path(path))
+        ) == sync_utils.abspath_from_uri(urlparse(path.as_uri()))
+
+
+class TestFetchRemotes:
+    def test_duplicate_alias_is_named_in_the_error(self, monkeypatch):
+        chest = EnderChest(
+            "file:///somewhere", name="steve", remotes=[("file:///else", "steve")]
+        )
+        monkeypatch.setattr(r, "load_remote_ender_chest", lambda uri: chest)
+
+        with pytest.raises(RuntimeError, match="'steve' appears more than once"):
+            r.fetch_remotes_from_a_remote_ender_chest("file:///somewhere")
+
+
 @pytest.mark.skipif(
     not shutil.which("rsync"), reason="rsync module cannot be imported on this system"
 )
@@ -993,6 +1030,22 @@ class TestRsyncSync(TestFileSync):
 
         assert printed_log == ""
 
+    @pytest.mark.parametrize("op", ("pull", "push"))
+    def test_local_transfers_are_not_compressed(
+        self, minecraft_root, remote, caplog, op
+    ):
+        caplog.set_level(logging.DEBUG)
+        gather.update_ender_chest(minecraft_root, remotes=(remote,))
+        r.sync_with_remotes(minecraft_root, op, verbosity=-1)
+
+        commands = [
+            record.args[0]
+            for record in caplog.records
+            if record.msg.startswith("Executing the following command")
+        ]
+        assert commands
+        assert all(" -shaW " in command for command in commands)
+
 
 def _is_paramiko_installed() -> bool:
     try:
@@ -1056,6 +1109,13 @@ class TestSFTPSync(TestFileSync):
     #     """Force cache gen, but just do it once"""
     #     pass
 
+    def test_close_pushes_to_every_remote(
+        self, minecraft_root, remote, tmp_path, use_local_ssh
+    ):
+        if not use_local_ssh:
+            pytest.skip("The mock SFTP server only knows about the one remote")
+        super().test_close_pushes_to_every_remote(minecraft_root, remote, tmp_path)
+
     def test_push_fails_if_remote_parent_folder_does_not_exist(self, minecraft_root):
         remote_path = Path("i do not exist").absolute()
         remote = ParseResult(
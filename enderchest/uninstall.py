@@ -57,14 +57,11 @@ def _break(
 
     for instance in instances:
         BREAK_LOGGER.info("Copying files into %s", instance.name)
-        for resource_path in instance.root.expanduser().rglob("*"):
-            if not resource_path.is_symlink():
-                continue
-
-            literal_target = resource_path.readlink()
-
+        for resource_path, literal_target in fs.symlinks_within(
+            instance.root.expanduser()
+        ):
             direct_target = Path(
-                os.path.normpath(resource_path.readlink().expanduser().absolute())
+                os.path.normpath(Path(literal_target).expanduser().absolute())
             )
 
             final_target = resource_path.resolve().expanduser()